@@ -1,8 +1,10 @@
 # coding: utf-8
 
+import pickle
+
 import pytest
 
-from ujsonpath import parse
+from ujsonpath import parse, Match
 
 
 @pytest.fixture
@@ -280,4 +282,68 @@ class TestFind:
         assert [match.value for match in parse(query).find(data)] == expected_values
         assert [match.path for match in parse(query).find(data)] == expected_paths
         for expected_path, expected_value in zip(expected_paths, expected_values):
-            assert [match.value for match in parse(expected_path).find(data)] == [expected_value]
\ No newline at end of file
+            assert [match.value for match in parse(expected_path).find(data)] == [expected_value]
+
+    def test_find_null_values(self):
+        data = {"level1": None, "level2": [None, {"level3": None}]}
+        assert [match.value for match in parse('level1').find(data)] == [None]
+        assert [match.value for match in parse('level2[0]').find(data)] == [None]
+        assert [match.path for match in parse('level2[*].level3').find(data)] == ['$["level2"][1]["level3"]']
+
+    def test_find_signed_list_index(self):
+        data = {'l': [10, 20, 30]}
+        assert [match.value for match in parse('l[+1]').find(data)] == [20]
+        assert [match.value for match in parse('l.+1').find(data)] == [20]
+        assert [match.value for match in parse('l[-1]').find(data)] == [30]
+
+    def test_iter_find(self, store_json):
+        query = 'store.book[*].author'
+        matches = parse(query).iter_find(store_json)
+        assert next(matches).value == 'Nigel Rees'
+        assert [match.value for match in matches] == ['Evelyn Waugh', 'Herman Melville', 'J. R. R. Tolkien']
+        assert [match.path for match in parse(query).iter_find(store_json)] == [
+            match.path for match in parse(query).find(store_json)]
+
+    def test_match_repr(self, store_json):
+        match = parse('store.bicycle').find(store_json)[0]
+        assert repr(match) == 'Match(value={0!r}, path=$["store"]["bicycle"])'.format(store_json['store']['bicycle'])
+        assert match.to_json_repr() == 'Match(value={"color": "red", "price": 19.95}, path=$["store"]["bicycle"])'
+        # values that can't be serialized as json
+        assert repr(parse('level1').find({'level1': set()})[0]) == 'Match(value={0!r}, path=$["level1"])'.format(set())
+
+    def test_find_values(self, store_json):
+        assert parse('store.bicycle.color').find_values(store_json) == ['red']
+        assert parse('store.bicycle.size').find_values(store_json) == []
+        assert parse('store.book[*].isbn').find_values(store_json) == ['0-553-21311-3', '0-395-19395-8', '0-395-19395-9']
+
+    def test_match_child_path(self):
+        root = Match({'level"1': [{'level2': 'A'}]}, '$')
+        match = root.child(root.value['level"1'], 'level"1').child({'level2': 'A'}, 0).child('A', 'level2')
+        assert match.path == '$["level\\"1"][0]["level2"]'
+        match.path = '$.level1'
+        assert (match.value, match.path) == ('A', '$.level1')
+
+    def test_match_pickle(self):
+        match = Match('A', '$["level1"]')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(match, protocol))
+            assert (unpickled.value, unpickled.path) == ('A', '$["level1"]')
+
+    def test_match_path_long_chain(self):
+        data = value = {}
+        for _ in range(1199):
+            value['a'] = {}
+            value = value['a']
+        value['a'] = 'A'
+        match = parse('.'.join(['a'] * 1200)).find(data)[0]
+        assert match.value == 'A'
+        assert match.path == '$' + '["a"]' * 1200
+
+    def test_match_path_none_key(self):
+        assert [match.path for match in parse('*').find({None: 1})] == ['$["None"]']
+
+    def test_match_pickle_without_parent(self, store_json):
+        match = parse('store.book[*].author').find(store_json)[0]
+        unpickled = pickle.loads(pickle.dumps(match))
+        assert (unpickled.value, unpickled.path) == ('Nigel Rees', '$["store"]["book"][0]["author"]')
+        assert len(pickle.dumps(match)) < 200
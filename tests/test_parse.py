@@ -1,6 +1,8 @@
 # coding: utf-8
 
-from ujsonpath import parse
+import pickle
+
+from ujsonpath import parse, JsonPath
 from ujsonpath import UnionOperator, OrOperator
 from ujsonpath import RootNodeType, WildcardNodeType, DescendantNodeType, SliceNodeType, IndexNodeType, IdentifierNodeType, ExpressionNodeType, FilterNodeType
 
@@ -9,172 +11,213 @@ class TestParse:
     def test_parse_root(self):
         query = '$'
         expected_nodes = [(RootNodeType, None)]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_fieldnames_one_level(self):
         query = 'level1'
         expected_nodes = [(IdentifierNodeType, ['level1'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_fieldnames_one_level_using_root(self):
         query = '$.level1'
         expected_nodes = [(RootNodeType, None), (IdentifierNodeType, ['level1'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_fieldnames_two_levels(self):
         query = 'level1.level2'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_fieldnames_multiple_levels(self):
         query = 'level1.level2.level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_fieldnames_escaped_separator(self):
         query = 'level1.level\\.2.level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level.2']), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_fieldnames_escaped_backslash(self):
         query = 'level1.level\\\\2.level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level\\2']), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_descendant_first_level(self):
         query = '..fieldname'
         expected_nodes = [(DescendantNodeType, None), (IdentifierNodeType, ['fieldname'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_descendant_second_level(self):
         query = 'level1..fieldname'
         expected_nodes = [(IdentifierNodeType, ['level1']), (DescendantNodeType, None), (IdentifierNodeType, ['fieldname'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_union(self):
         query = 'level1.level2[4,2].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, UnionOperator(['4', '2'])), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[4,2]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, UnionOperator(['4', '2']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.[level2a, level2b]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, UnionOperator(['level2a', 'level2b']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.["level2a",level2b]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, UnionOperator(['level2a', 'level2b']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = "level1.['level2a',  'level2b']"
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, UnionOperator(['level2a', 'level2b']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_or(self):
         query = 'level1.level2[4|2].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, OrOperator(['4', '2'])), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[4|2]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, OrOperator(['4', '2']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.[level2a | level2b]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, OrOperator(['level2a', 'level2b']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.["level2a"|level2b]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, OrOperator(['level2a', 'level2b']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = "level1.['level2a'|  'level2b']"
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, OrOperator(['level2a', 'level2b']))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_index(self):
         query = 'level1.level2[42].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, ['42']), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[42]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, ['42'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_index_nested(self):
         query = 'level1.level2[4][2].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, ['4']), (IndexNodeType, ['2']), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[4][2]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IndexNodeType, ['4']), (IndexNodeType, ['2'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_index_string(self):
         query = 'level1.level2[level3].level4'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IdentifierNodeType, ['level3']), (IdentifierNodeType, ['level4'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1[level2][level3][level4]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IdentifierNodeType, ['level3']), (IdentifierNodeType, ['level4'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1["level2"]["level3"]["level4"]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IdentifierNodeType, ['level3']), (IdentifierNodeType, ['level4'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = "level1['level2']['level3']['level4']"
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IdentifierNodeType, ['level3']), (IdentifierNodeType, ['level4'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_wildcard(self):
         query = 'level1.level2[*].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (WildcardNodeType, None), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[*]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (WildcardNodeType, None)]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_slice_start_only(self):
         query = 'level1.level2[1:].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (SliceNodeType, slice(1)), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[1:]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (SliceNodeType, slice(1))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_slice_end_only(self):
         query = 'level1.level2[:3].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (SliceNodeType, slice(None, 3)), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[:3]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (SliceNodeType, slice(None, 3))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_slice_start_and_end(self):
         query = 'level1.level2[1:3].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (SliceNodeType, slice(1, 3)), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
         query = 'level1.level2[1:3]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (SliceNodeType, slice(1, 3))]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_invalid_slice(self):
         query = 'level1.level2[a:3].level3'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (IdentifierNodeType, ['a:3']), (IdentifierNodeType, ['level3'])]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_expression(self):
         query = 'level1.level2[(@.length-1)]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (ExpressionNodeType, '@.length-1')]
-        assert parse(query).nodes == expected_nodes
+        assert list(parse(query).nodes) == expected_nodes
 
     def test_parse_filter(self):
         query = 'level1.level2[?(@.price==8.95)]'
         expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['level2']), (FilterNodeType, '@.price==8.95')]
-        assert parse(query).nodes == expected_nodes
\ No newline at end of file
+        assert list(parse(query).nodes) == expected_nodes
+
+    def test_parse_cached(self):
+        query = 'level1.level2[*].level3'
+        assert parse(query) is parse(query)
+        parse.cache_clear()
+        jsonpath = parse(query)
+        assert jsonpath is parse(query)
+        assert jsonpath.nodes == parse(' ' + query).nodes
+
+    def test_parse_cache_info(self):
+        parse.cache_clear()
+        parse('level1.level2')
+        parse('level1.level2')
+        cache_info = parse.cache_info()
+        assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 1, 1)
+
+    def test_jsonpath_hash_and_pickle(self):
+        jsonpath = parse('$.level1[1:3][a, b][c | d]')
+        other = JsonPath(parse('$.level1[1:3][a, b][c | d]').nodes)
+        assert jsonpath == other
+        assert hash(jsonpath) == hash(other)
+        assert jsonpath != parse('$.level1[1:3]')
+        unpickled = pickle.loads(pickle.dumps(jsonpath))
+        assert unpickled == jsonpath
+        data = {'level1': [0, {'a': 1, 'b': {'d': 2}}, {'a': {'c': 3, 'd': 4}}]}
+        assert [match.value for match in unpickled.find(data)] == [2, 3]
+
+        union = parse('x[a,b]')
+        assert union != parse('x[a|b]')
+        assert parse('x[a|b]') not in {union}
+        assert parse('x[a]') != union
+        assert union != parse('x[a]')
+
+    def test_parse_escaped_backslash_before_union(self):
+        query = 'level1[a\\\\,b]'
+        expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, UnionOperator(['a\\', 'b']))]
+        assert list(parse(query).nodes) == expected_nodes
+
+        query = 'level1[a\\,b]'
+        expected_nodes = [(IdentifierNodeType, ['level1']), (IdentifierNodeType, ['a,b'])]
+        assert list(parse(query).nodes) == expected_nodes
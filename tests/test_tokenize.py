@@ -39,6 +39,11 @@ class TestTokenize:
         expected_tokens = ['level1', 'level\\\\2', 'level3']
         assert list(tokenize(query)) == expected_tokens
 
+    def test_tokenize_fieldnames_escaped_separator_before_separator(self):
+        query = 'level1\\..level2'
+        expected_tokens = ['level1\\.', 'level2']
+        assert list(tokenize(query)) == expected_tokens
+
     def test_tokenize_descendant_first_level(self):
         query = '..fieldname'
         expected_tokens = ['..', 'fieldname']
@@ -1,8 +1,56 @@
 # coding: utf-8
 
 import json
+import re
 from collections import namedtuple
 
+try:
+    from functools import lru_cache
+except ImportError:  # pragma: no cover
+    # Python 2 doesn't have lru_cache, so use a simple bounded memoization instead
+    _CacheInfo = namedtuple('CacheInfo', 'hits, misses, maxsize, currsize')
+
+    def lru_cache(maxsize=128):
+        def decorator(func):
+            cache = {}
+            # hits and misses
+            stats = [0, 0]
+
+            def wrapper(arg):
+                try:
+                    result = cache[arg]
+                    stats[0] += 1
+                except KeyError:
+                    stats[1] += 1
+                    if len(cache) >= maxsize:
+                        cache.clear()
+                    result = cache[arg] = func(arg)
+                return result
+
+            def cache_info():
+                return _CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+            def cache_clear():
+                cache.clear()
+                stats[:] = [0, 0]
+
+            wrapper.__doc__ = func.__doc__
+            wrapper.__name__ = func.__name__
+            wrapper.cache_info = cache_info
+            wrapper.cache_clear = cache_clear
+            return wrapper
+        return decorator
+
+try:
+    from sys import intern
+except ImportError:  # pragma: no cover
+    # Python 2 has intern as builtin, but it only accepts byte strings
+    def intern(string, _intern=intern):
+        return _intern(string) if isinstance(string, str) else string
+
+# Maximum number of parsed queries kept in memory
+PARSE_CACHE_SIZE = 512
+
 # Symbols
 ROOT_SYMBOL = '$'
 SELF_SYMBOL = '@'
@@ -22,6 +70,23 @@ UNION_OPERATOR_SYMBOL = ','
 OR_OPERATOR_SYMBOL = '|'
 FILTER_OPERATOR_SYMBOL = '?'
 IDENTIFIER_SYMBOL = '.'
+_ESCAPED_SLICE_OPERATOR = ESCAPE_SYMBOL + SLICE_OPERATOR_SYMBOL
+
+# Regular expressions used by tokenizer
+# quoted sections start with a quote or "(" and end with the matching symbol, escaped chars never close them
+_QUOTED_PATTERN = r'''"(?:\\.?|[^"\\])*"?|'(?:\\.?|[^'\\])*'?|\((?:\\.?|[^)\\])*\)?'''
+_TOKEN_RE = re.compile(r'''(\.\.)|[.\[\]]|((?:\\.?|{quoted}|[^.\[\]\\"'(])+)'''.format(quoted=_QUOTED_PATTERN), re.S)
+_QUOTE_START_RE = re.compile(r'''["'(]''')
+_QUOTED_RE = re.compile(r'\\.?|({quoted})'.format(quoted=_QUOTED_PATTERN), re.S)
+_QUOTED_SPECIAL_RE = re.compile(r'\\.|[,:|]', re.S)
+# queries without quotes or escaped chars are split by the separators only
+_PLAIN_SEPARATOR_RE = re.compile(r'(\.\.)|[.\[\]]')
+_NOT_PLAIN_RE = re.compile(r'''[\\"'(]''')
+# quoted sections only need to be changed when they have special symbols
+_SPECIAL_RE = re.compile(r'[,:|]')
+
+# Escaped special chars in identifiers, unescaped in a single pass
+_UNESCAPE_RE = re.compile(r'''\\([\\,|:.'"$])''')
 
 
 # Node types
@@ -34,33 +99,64 @@ class BaseNodeType(object):
     def evaluate(cls, node, data, root):
         raise NotImplementedError()
 
+    @classmethod
+    def compile(cls, node):
+        """
+        Create the function used to evaluate the node.
+        It is called once, when the JsonPath object is created.
+        :param node: Node
+        :return: function receiving an iterable with the matches found so far and the root match,
+                 returning an iterator over the new matches
+        """
+        evaluate = cls.evaluate
+
+        def step(matches, root):
+            # evaluate the node for each match lazily, chaining the results in a single flat iterator
+            return (match for data in matches for match in evaluate(node, data, root))
+        return step
+
+
+class UnsupportedNodeType(BaseNodeType):
+    @classmethod
+    def compile(cls, node):
+        def step(matches, root):
+            # fail even if there is nothing left to evaluate
+            raise NotImplementedError()
+        return step
+
 
 class RootNodeType(BaseNodeType):
     @classmethod
     def evaluate(cls, node, data, root):
         return [root]
 
+    @classmethod
+    def compile(cls, node):
+        def step(matches, root):
+            return (root for data in matches)
+        return step
+
 
-class SelfNodeType(BaseNodeType):
+class SelfNodeType(UnsupportedNodeType):
     pass
 
 
 class WildcardNodeType(BaseNodeType):
     @classmethod
     def evaluate(cls, node, data, root):
-        basepath = data.path
+        child = data.child
         data = data.value
         # wildcard should work for lists and dicts
         if isinstance(data, list):
-            value = [Match(val, '{0}[{1}]'.format(basepath, idx)) for idx, val in enumerate(data)]
+            value = [child(val, idx) for idx, val in enumerate(data)]
         elif isinstance(data, dict):
-            value = [Match(val, '{0}["{1}"]'.format(basepath, key.replace('"', '\\"'))) for key, val in data.items()]
+            value = [child(val, key) for key, val in data.items()]
         else:
-            value = [MatchNotFound()]
+            value = []
         return value
 
 
-class DescendantNodeType(BaseNodeType):
+class DescendantNodeType(UnsupportedNodeType):
     pass
 
 
@@ -71,23 +167,23 @@ class SliceNodeType(BaseNodeType):
 
     @classmethod
     def evaluate(cls, node, data, root):
-        basepath = data.path
+        child = data.child
+        index = node.value
         try:
             indices = range(len(data.value))
-            value = [Match(val, '{0}[{1}]'.format(basepath, idx))
-                     for idx, val in zip(indices[node.value], data.value[node.value])]
+            value = [child(val, idx) for idx, val in zip(indices[index], data.value[index])]
         except (KeyError, TypeError):
-            value = [MatchNotFound()]
+            value = []
         return value
 
 
-class ExpressionNodeType(BaseNodeType):
+class ExpressionNodeType(UnsupportedNodeType):
     @classmethod
     def process_value(cls, value):
         return value[1:-1]
 
 
-class FilterNodeType(BaseNodeType):
+class FilterNodeType(UnsupportedNodeType):
     @classmethod
     def process_value(cls, value):
         return value[2:-1]
@@ -109,57 +205,147 @@ class IndexNodeType(BaseNodeType):
 
         value = clean_list(value)
         # unescape special chars from itentifier
-        value = [unquote(val).replace(
-            ESCAPE_SYMBOL + ESCAPE_SYMBOL, ESCAPE_SYMBOL).replace(
-            ESCAPE_SYMBOL + UNION_OPERATOR_SYMBOL, UNION_OPERATOR_SYMBOL).replace(
-            ESCAPE_SYMBOL + OR_OPERATOR_SYMBOL, OR_OPERATOR_SYMBOL).replace(
-            ESCAPE_SYMBOL + SLICE_OPERATOR_SYMBOL, SLICE_OPERATOR_SYMBOL).replace(
-            ESCAPE_SYMBOL + IDENTIFIER_SYMBOL, IDENTIFIER_SYMBOL).replace(
-            ESCAPE_SYMBOL + SINGLE_QUOTE_SYMBOL, SINGLE_QUOTE_SYMBOL).replace(
-            ESCAPE_SYMBOL + DOUBLE_QUOTE_SYMBOL, DOUBLE_QUOTE_SYMBOL).replace(
-            ESCAPE_SYMBOL + ROOT_SYMBOL, ROOT_SYMBOL
-        ) for val in value]
+        value = [_UNESCAPE_RE.sub(r'\1', unquote(val)) for val in value]
+        # identifiers are used as dict keys on every evaluation, interned strings are compared by identity
+        value = [intern(val) for val in value]
 
         value = operator(value)
         return value
 
     @classmethod
     def evaluate(cls, node, data, root):
-        basepath = data.path
-        # both, identifier and index, can be accessed as a key
+        value = cls.get_matches(data, _get_indexed_keys(node.value))
+        if isinstance(node.value, Operator):
+            value = node.value.transform(value)
+        return value
+
+    @classmethod
+    def compile(cls, node):
+        # identifiers are converted to list index once, not on every evaluation
+        keys = _get_indexed_keys(node.value)
+        get_matches = cls.get_matches
+        if not isinstance(node.value, Operator):
+            def step(matches, root):
+                return (match for data in matches for match in get_matches(data, keys))
+            return step
+
+        # the operator is known at parse time, so bind its transform once
+        transform = node.value.transform
+
+        def step(matches, root):
+            return (match for data in matches for match in transform(get_matches(data, keys)))
+        return step
+
+    @classmethod
+    def get_matches(cls, data, keys):
+        """
+        Get the items identified by each key from the matched data.
+        :param data: Match
+        :param keys: list of (key, index) tuples, as returned by _get_indexed_keys
+        :return: list of Match objects
+        """
+        get_match = cls.get_match
         value = []
-        for val in node.value:
+        for key, index in keys:
+            match = get_match(data, key, index)
+            if match is not None:
+                value.append(match)
+        return value
+
+    @classmethod
+    def get_match(cls, data, key, index=None):
+        """
+        Get the item identified by key from the matched data.
+        :param data: Match
+        :param key: string
+        :param index: key converted to integer, or None if it can't be used as list index
+        :return: Match object or None if not found
+        """
+        child = data.child
+        data = data.value
+        # both, identifier and index, can be accessed as a key
+        if isinstance(data, dict):
+            # missing keys are common when querying lists of objects, so avoid raising exceptions for them
+            item = data.get(key, _MISSING)
+            if item is not _MISSING:
+                return child(item, key)
+            if index is not None:
+                item = data.get(index, _MISSING)
+                if item is not _MISSING:
+                    return child(item, index)
+        elif isinstance(data, list):
+            # lists can only be accessed by index, check the bounds instead of catching IndexError
+            if index is not None and -len(data) <= index < len(data):
+                return child(data[index], index)
+        else:
             try:
                 # try to access directly
-                path = '{0}["{1}"]'.format(basepath, val.replace('"', '\\"'))
-                value.append(Match(data.value[val], path))
+                return child(data[key], key)
             except (IndexError, KeyError, TypeError):
                 try:
                     # try to convert key to integer
-                    val = int(val)
-                    path = '{0}[{1}]'.format(basepath, val)
-                    value.append(Match(data.value[val], path))
+                    key = int(key)
+                    return child(data[key], key)
                 except (ValueError, IndexError, KeyError, TypeError):
-                    # Match not found... try next
                     pass
-        if isinstance(node.value, Operator):
-            value = node.value.transform(value)
-        return value
+        return None
+
+    @classmethod
+    def compile_chain(cls, keys):
+        """
+        Create the function used to evaluate a sequence of nodes accessing a single key each.
+        :param keys: list of keys, in the order they are accessed
+        :return: function with the same signature as the ones created by compile
+        """
+        keys = _get_indexed_keys(keys)
+        get_match = cls.get_match
+
+        def step(matches, root):
+            for match in matches:
+                for key, index in keys:
+                    match = get_match(match, key, index)
+                    if match is None:
+                        break
+                else:
+                    yield match
+        return step
 
 
 IdentifierNodeType = IndexNodeType
 
 
+# Node types identified by the whole token or by its first char
+_NODE_TYPES = {
+    ROOT_SYMBOL: RootNodeType,
+    DESCENDANT_SYMBOL: DescendantNodeType,
+    WILDCARD_SYMBOL: WildcardNodeType,
+    FILTER_OPERATOR_SYMBOL: FilterNodeType,
+    EXPRESSION_START_SYMBOL: ExpressionNodeType,
+    SINGLE_QUOTE_SYMBOL: IdentifierNodeType,
+    DOUBLE_QUOTE_SYMBOL: IdentifierNodeType,
+}
+
+
 Node = namedtuple('Node', 'type, value')
 
+# Used to tell missing keys apart from keys with None as value
+_MISSING = object()
+
 
 class Operator(object):
     def __init__(self, identifiers):
         self.identifiers = identifiers
 
     def __eq__(self, other):
+        # union and or operators with the same identifiers match different values
+        if type(other) is not type(self):
+            return NotImplemented
         return self.identifiers == other.identifiers
 
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
     def __getitem__(self, i):
         return self.identifiers[i]
 
@@ -192,53 +378,224 @@ class MatchNotFound(object):
 
 
 class Match(object):
+    __slots__ = ('value', '_path', '_parent', '_key')
+
     def __init__(self, value, path):
-        self.path = path
-        try:
-            # value can be an instance of Match
-            self.value = value.value
-        except AttributeError:
-            self.value = value
+        self._path = path
+        self._parent = None
+        self._key = _MISSING
+        # value can be an instance of Match
+        self.value = value.value if isinstance(value, Match) else value
+
+    @property
+    def path(self):
+        # read them once, another thread may be building the same path and clearing them,
+        # _path is always set before they are cleared
+        parent, key = self._parent, self._key
+        if parent is None or key is _MISSING:
+            return self._path
+        # build the path only when it is needed, most intermediate matches never have their path read
+        if parent._parent is None:
+            # siblings share a parent whose path is usually known already
+            path = _format_path(parent._path, key)
+        else:
+            path = _build_path(parent, key)
+        self._path = path
+        self._parent = None
+        self._key = _MISSING
+        return path
+
+    @path.setter
+    def path(self, path):
+        self._path = path
+        self._parent = None
+        self._key = _MISSING
+
+    def child(self, value, key):
+        """
+        Create the match for an item of this match value.
+        :param value: item value
+        :param key: dict key or list index of the item
+        :return: Match object
+        """
+        match = Match.__new__(Match)
+        match.value = value
+        match._path = None
+        match._parent = self
+        match._key = key
+        return match
+
+    def __reduce__(self):
+        # classes with __slots__ can't be pickled with protocols 0 and 1, and only the value and path need to be kept
+        return Match, (self.value, self.path)
 
     def __repr__(self):
+        return u'Match(value={value!r}, path={path})'.format(value=self.value, path=self.path)
+
+    def to_json_repr(self):
+        """
+        Representation of the match with the value serialized as json.
+        :return: string
+        """
         return u'Match(value={value}, path={path})'.format(value=json.dumps(self.value), path=self.path)
 
 
+def _build_path(match, key):
+    # walk up to the closest match with a known path without recursion, so long chains don't hit the recursion limit
+    pending = []
+    while True:
+        parent, parent_key = match._parent, match._key
+        if parent is None or parent_key is _MISSING:
+            break
+        pending.append((match, parent_key))
+        match = parent
+    path = match._path
+    for match, parent_key in reversed(pending):
+        path = _format_path(path, parent_key)
+        # keep the path of intermediate matches too, their other children need it
+        match._path = path
+        match._parent = None
+        match._key = _MISSING
+    return _format_path(path, key)
+
+
+def _format_path(path, key):
+    if isinstance(key, int):
+        return '{0}[{1}]'.format(path, key)
+    try:
+        key = key.replace('"', '\\"')
+    except AttributeError:
+        # keys that aren't strings, like None, are formatted as they are
+        pass
+    return '{0}["{1}"]'.format(path, key)
+
+
 class JsonPath(object):
+    """
+    Parsed json path query.
+    It holds no state changed by find, so the same object can be shared by the parse cache and used by many threads.
+    """
+
+    __slots__ = ('nodes', '_steps', '_keys')
+
     def __init__(self, nodes):
-        self.nodes = nodes
+        self.nodes = tuple(nodes)
+        self._steps = tuple(_compile_steps(self.nodes))
+        # queries without wildcards, slices or operators match one value at most, find() walks them with a plain loop
+        self._keys = _get_single_match_keys(self.nodes)
 
     def __repr__(self):
         return u'JsonPath(nodes={nodes})'.format(nodes=self.nodes)
 
-    def find(self, data):
-        data = Match(data, ROOT_SYMBOL)
-        root = data
-        values = []
+    def __eq__(self, other):
+        return isinstance(other, JsonPath) and self.nodes == other.nodes
 
-        nodes = self.nodes
-        while nodes:
-            node = nodes[0]
-            nodes = nodes[1:]
-            node_value = _evaluate_node(node, data, root)
-            data = node_value
-            if not nodes:
-                values = node_value
+    def __ne__(self, other):
+        return not self == other
 
-        return [value for value in values if not isinstance(value, MatchNotFound)]
+    def __hash__(self):
+        # node values are lists, so hash their representation instead
+        return hash(repr(self.nodes))
 
+    def __reduce__(self):
+        # compiled steps can't be pickled, so create them again from the nodes
+        return JsonPath, (self.nodes, )
 
-def _evaluate_node(node, data, root):
+    def find(self, data):
+        if self._keys is not None:
+            match = Match(data, ROOT_SYMBOL)
+            get_match = IndexNodeType.get_match
+            for key, index in self._keys:
+                match = get_match(match, key, index)
+                if match is None:
+                    return []
+            return [match]
+        return list(self.iter_find(data))
+
+    def find_values(self, data):
+        """
+        Find the values matched by the query, when their paths are not needed.
+        :param data: parsed json data
+        :return: list
+        """
+        # the single match loop is faster than iterating lazily
+        matches = self.find(data) if self._keys is not None else self.iter_find(data)
+        return [match.value for match in matches]
+
+    def iter_find(self, data):
+        """
+        Find the matches lazily, evaluating the query only as far as needed to get the next match.
+        :param data: parsed json data
+        :return: iterator over Match objects
+        """
+        root = Match(data, ROOT_SYMBOL)
+        # each node is evaluated for all matches found by the previous one,
+        # misses are simply dropped so the matches never need to be filtered or flattened
+        matches = iter([root] if self._steps else [])
+        for step in self._steps:
+            matches = step(matches, root)
+        return matches
+
+
+def _get_indexed_keys(keys):
+    # pair each key with its value as list index, so it doesn't need to be converted on every evaluation
+    return tuple((key, _get_index(key)) for key in keys)
+
+
+def _get_index(key):
+    # accept the same identifiers as int(), as list index
     try:
-        value = [_evaluate_node(node, datum, root) for datum in data]
-    except TypeError:
-        value = node.type.evaluate(node, data, root)
-    # if the original query have more than one wildcard, we can get a list of lists
-    # but we want a flat list
-    value = join_lists(value)
-    if not value:
-        value = [MatchNotFound()]
-    return value
+        return int(key)
+    except ValueError:
+        return None
+
+
+def _is_single_key(node):
+    # identifier or index node without union or or operator
+    return node.type is IndexNodeType and type(node.value) is list and len(node.value) == 1
+
+
+def _get_single_match_keys(nodes):
+    if not nodes:
+        return None
+    if nodes[0].type is RootNodeType:
+        nodes = nodes[1:]
+    if not all(_is_single_key(node) for node in nodes):
+        return None
+    return _get_indexed_keys(node.value[0] for node in nodes)
+
+
+def _compile_steps(nodes):
+    steps = []
+    keys = []
+    for node in nodes:
+        if _is_single_key(node):
+            # consecutive nodes accessing a single key are evaluated at once,
+            # without building a list of matches for each one of them
+            keys.append(node.value[0])
+            continue
+        if keys:
+            steps.append(IndexNodeType.compile_chain(keys))
+            keys = []
+        steps.append(node.type.compile(node))
+    if keys:
+        steps.append(IndexNodeType.compile_chain(keys))
+    return steps
+
+
+def _escape_special(match):
+    symbol = match.group(0)
+    # escaped chars are kept as is
+    return symbol if symbol[0] == ESCAPE_SYMBOL else ESCAPE_SYMBOL + symbol
+
+
+def _escape_quoted(match):
+    quoted = match.group(1)
+    if quoted is None:
+        # escaped char outside quotes, keep it as is
+        return match.group(0)
+    # escape special symbols inside quotes
+    return _QUOTED_SPECIAL_RE.sub(_escape_special, quoted)
 
 
 def generate_tokens(query):
@@ -248,55 +605,22 @@ def generate_tokens(query):
     :return: list
     """
 
-    previous_char = ''
-    token = ''
-    escaped = False
-    quoted = False
-    quote_used = ''
-
-    # open/close quote equivalence
-    quotes = {
-        SINGLE_QUOTE_SYMBOL: SINGLE_QUOTE_SYMBOL,
-        DOUBLE_QUOTE_SYMBOL: DOUBLE_QUOTE_SYMBOL,
-        EXPRESSION_START_SYMBOL: EXPRESSION_END_SYMBOL,
-    }
-
     query = query.strip()
-    for char in query:
-        if escaped:
-            # don't try to interpret the meaning of the current char if it is escaped
-            escaped = False
-            token += char
-        elif char in ESCAPE_SYMBOL:
-            # the next char will be escaped
-            escaped = True
-            token += char
-        elif quoted:
-            # don't try to interpret the meaning of chars inside quotes
-            if char in (UNION_OPERATOR_SYMBOL, SLICE_OPERATOR_SYMBOL, OR_OPERATOR_SYMBOL):
-                # escape special symbols
-                token += ESCAPE_SYMBOL
-            # check if it is time to close the quote
-            quoted = not char == quotes[quote_used]
-            token += char
-        elif char in quotes:
-            # starting quote
-            quote_used = char
-            quoted = True
-            token += char
-        elif previous_char + char == DESCENDANT_SYMBOL:
-            # descendant is a special case because it uses the same symbol used to separate identifiers (".")
+    if not _NOT_PLAIN_RE.search(query):
+        # most queries are plain dotted paths and indexes, split them in a single call
+        for token in _PLAIN_SEPARATOR_RE.split(query):
+            if token:
+                yield token
+        return
+
+    for descendant, token in _TOKEN_RE.findall(query):
+        if descendant:
             yield DESCENDANT_SYMBOL
-        elif char in (IDENTIFIER_SYMBOL, BRACKET_START_SYMBOL, BRACKET_END_SYMBOL):
-            # reached a token separator
+        elif token:
+            if _SPECIAL_RE.search(token) and _QUOTE_START_RE.search(token):
+                # don't try to interpret the meaning of chars inside quotes
+                token = _QUOTED_RE.sub(_escape_quoted, token)
             yield token
-            token = ''
-        else:
-            token += char
-
-        previous_char = char
-
-    yield token
 
 
 def tokenize(query):
@@ -307,22 +631,13 @@ def tokenize(query):
     return tokens
 
 
-def _get_node_type(token):
-    node_types = {
-        ROOT_SYMBOL: RootNodeType,
-        DESCENDANT_SYMBOL: DescendantNodeType,
-        WILDCARD_SYMBOL: WildcardNodeType,
-        FILTER_OPERATOR_SYMBOL: FilterNodeType,
-        EXPRESSION_START_SYMBOL: ExpressionNodeType,
-        SINGLE_QUOTE_SYMBOL: IdentifierNodeType,
-        DOUBLE_QUOTE_SYMBOL: IdentifierNodeType,
-    }
+def _get_node_type(token, node_types=_NODE_TYPES):
     # try to get nodes identified by the whole token
     # ("$" == ROOT, "*" == WILDCARD, ".." == DESCENDANT)
     node_type = node_types.get(token.strip(), None)
     if not node_type:
         # check if token has slice symbol, but ignore escaped occurrences
-        if SLICE_OPERATOR_SYMBOL in token.replace(ESCAPE_SYMBOL + SLICE_OPERATOR_SYMBOL, ''):
+        if SLICE_OPERATOR_SYMBOL in token.replace(_ESCAPED_SLICE_OPERATOR, ''):
             # it is slice if we found the slice separator
             node_type = SliceNodeType
         else:
@@ -333,9 +648,11 @@ def _get_node_type(token):
     return node_type
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse(query):
     """
     Parse json path query.
+    The result is cached, so parsing the same query again returns the same JsonPath object.
     :param query: string
     :return: JsonPath object
     """
@@ -373,13 +690,22 @@ def clean_list(data, exclude=tuple(), strip=SPACE_SYMBOL):
 
 
 def escaped_split(string, char):
-    sections = [section + (char if section.endswith(ESCAPE_SYMBOL) else '') for section in string.split(char)]
-    result = [''] * len(sections)
-    idx = 0
-    for section in sections:
-        result[idx] += section
-        idx += int(not section.endswith(char))
-    return clean_list(result, exclude=('',))
+    result = []
+    escaped = []
+    for section in string.split(char):
+        if (len(section) - len(section.rstrip(ESCAPE_SYMBOL))) % 2:
+            # char was escaped by an odd number of backslashes, so the section continues after it
+            escaped.append(section)
+            continue
+        if escaped:
+            escaped.append(section)
+            section = char.join(escaped)
+            escaped = []
+        if section:
+            result.append(section.strip(SPACE_SYMBOL))
+    if escaped:
+        result.append(char.join(escaped).strip(SPACE_SYMBOL))
+    return result
 
 
 def unquote(string):